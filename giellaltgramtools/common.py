@@ -95,53 +95,3 @@ def extract_correction(child):
 def colourise(string, *args, **kwargs):
     kwargs.update(COLORS)
     return string.format(*args, **kwargs)
-
-
-# class UI(ArgumentParser):
-#     def __init__(self):
-#         super().__init__()
-#         self.add_argument(
-#             "-c",
-#             "--colour",
-#             dest="colour",
-#             action="store_true",
-#             help="Colours the output",
-#         )
-#         self.test = None
-
-#     def start(self):
-#         ret = self.test.run()
-#         sys.stdout.write(str(self.test))
-#         sys.exit(ret)
-
-
-# class CorpusUI(UI):
-#     def __init__(self):
-#         super().__init__()
-#         self.add_argument(
-#             "--ignore-typos",
-#             dest="ignore_typos",
-#             action="store_true",
-#             help="Pretend as if typos are correct",
-#         )
-#         self.add_argument("archive", help="The grammarchecker archive")
-#         self.add_argument(
-#             "targets",
-#             nargs="+",
-#             help="""Name of the file or directories to process.
-#                         If a directory is given, all files in this directory
-#                         and its subdirectories will be listed.""",
-#         )
-
-#         self.test = CorpusGramTest(self.parse_args())
-
-
-# def main():
-#     try:
-#         ui = CorpusUI()
-#         ui.start()
-#     except KeyboardInterrupt:
-#         sys.exit(130)
-#     except Exception as error:
-#         print(f"An error occurred: {error}")
-#         raise SystemExit from error
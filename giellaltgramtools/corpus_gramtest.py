@@ -93,17 +93,22 @@ class CorpusGramTest(GramTest):
     def make_test_results(self) -> Iterable[TestData]:
         grammarchecker = CorpusGramChecker(self.archive, self.ignore_typos)
 
-        for filename in ccat.find_files(self.targets, ".xml"):
-            root = parse(filename)
-            self.keep_url(root)
-            error_datas = list(self.get_error_data(filename, grammarchecker))
-            grammar_datas = grammarchecker.check_paragraphs(
-                "\n".join(error_data[0].rstrip() for error_data in error_datas)
+        # Check the paragraphs of all files with one divvun-checker run,
+        # rather than starting a new one for each file
+        error_datas = [
+            (filename, error_data)
+            for filename in ccat.find_files(self.targets, ".xml")
+            for error_data in self.get_error_data(filename, grammarchecker)
+        ]
+        grammar_datas = grammarchecker.check_paragraphs(
+            "\n".join(error_data[0].rstrip() for _, error_data in error_datas)
+        )
+        for (filename, error_data), grammar_data in zip(
+            error_datas, grammar_datas, strict=True
+        ):
+            yield grammarchecker.clean_data(
+                sentence=error_data[0],
+                expected_errors=error_data[1],
+                gramcheck_errors=grammar_data,
+                filename=filename,
             )
-            for item in zip(error_datas, grammar_datas, strict=True):
-                yield grammarchecker.clean_data(
-                    sentence=item[0][0],
-                    expected_errors=item[0][1],
-                    gramcheck_errors=item[1],
-                    filename=filename,
-                )
@@ -3,15 +3,23 @@
 # Copyright © 2024 UiT The Arctic University of Norway
 # License: GPL3  # noqa: ERA001
 # Author: Børre Gaup <borre.gaup@uit.no>
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorData:
     error_string: str
     start: int
-    end: int | None
+    end: int
     error_type: str
     explanation: str
-    suggestions: list[str] = field(default_factory=list)
+    suggestions: tuple[str, ...] = ()
     native_error_type: str | None = None
+
+    def __post_init__(self):
+        # suggestions from divvun-checker arrive as lists
+        object.__setattr__(self, "suggestions", tuple(self.suggestions))
+        # the same few error types and explanations repeat over and over
+        object.__setattr__(self, "error_type", sys.intern(self.error_type))
+        object.__setattr__(self, "explanation", sys.intern(self.explanation))
@@ -6,6 +6,7 @@
 
 import json
 import subprocess
+from copy import deepcopy
 from dataclasses import replace
 
 from lxml.etree import _Element
@@ -17,6 +18,7 @@ from giellaltgramtools.testdata import TestData
 class GramChecker:
     def __init__(self, ignore_typos=False):
         self.ignore_typos = ignore_typos
+        self.checked_sentences = {}
 
     def check_paragraphs(self, paragraphs):
         """Check grammar of a paragraphs."""
@@ -28,12 +30,23 @@ class GramChecker:
             check=True,
         )
 
-        lines = result.stdout.decode("utf-8").strip().split("\n")
         return [
-            self.fix_all_errors(gram_error.get("errs"))
-            for gram_error in json.loads(f"[{','.join(lines)}]")
+            self.fix_all_errors(json.loads(line).get("errs"))
+            for line in result.stdout.splitlines()
         ]
 
+    def check_sentence(self, sentence):
+        """Check grammar of a single sentence.
+
+        Every call to check_paragraphs starts a new divvun-checker, so
+        results are kept and reused when the same sentence is rechecked.
+        """
+        if sentence not in self.checked_sentences:
+            self.checked_sentences[sentence] = self.check_paragraphs(sentence)[0]
+
+        # callers modify the returned errors
+        return deepcopy(self.checked_sentences[sentence])
+
     @staticmethod
     def remove_dupes(double_spaces, d_errors):
         for removable_error in [
@@ -94,7 +107,7 @@ class GramChecker:
         d_error[5] = ["”"]
         d_error[2] = d_error[1] + 1
 
-        new_d_error = self.check_paragraphs(sentence)[0]
+        new_d_error = self.check_sentence(sentence)
         if new_d_error:
             new_d_error[0][1] = d_error[1] + 1
             new_d_error[0][2] = d_error[1] + 1 + len(sentence)
@@ -106,7 +119,7 @@ class GramChecker:
         d_error[5] = ["”"]
         d_error[1] = d_error[2] - 1
 
-        new_d_error = self.check_paragraphs(sentence)[0]
+        new_d_error = self.check_sentence(sentence)
         if new_d_error:
             new_d_error[0][1] = d_error[1] - len(sentence)
             new_d_error[0][2] = d_error[1]
@@ -128,13 +141,14 @@ class GramChecker:
                 error[3],
                 error[4],
                 [suggestion[1:-1] for suggestion in error[5]],
+                error[6],
             ]
 
-        aistton_both_ranges = [
+        aistton_both_ranges = {
             (error[1], error[2])
             for error in d_errors
             if error[3] == "punct-aistton-both"
-        ]
+        }
         return [
             fix_hidden_error(error) if is_hidden_error(error) else error
             for error in d_errors
@@ -194,46 +208,61 @@ class GramChecker:
         self, parts: list[str], errors: list[ErrorData | None], para: _Element
     ) -> ErrorData | None:
         """Only collect unnested errors."""
-        info = None
+        info, _ = self.extract_error_info_at(
+            parts, errors, para, sum(len(part) for part in parts)
+        )
+        return info
 
+    def extract_error_info_at(
+        self,
+        parts: list[str],
+        errors: list[ErrorData | None],
+        para: _Element,
+        start: int,
+    ) -> tuple[ErrorData | None, int]:
+        """Only collect unnested errors.
+
+        start is the length of the text in parts. The offset after para
+        is returned, so the parts never have to be joined to find offsets.
+        """
+        end = start
+        if para.text:
+            parts.append(para.text)
+            end += len(para.text)
+
+        for child in para:
+            if child.tag != "correct":
+                child_info, end = self.extract_error_info_at(parts, errors, child, end)
+                if self.is_non_nested_error(child):
+                    errors.append(child_info)
+
+        info = None
         if para.tag.startswith("error"):
             correct = para.find("./correct")
             info = ErrorData(
                 error_string=(
                     self.get_error_corrections(para) if len(para) else para.text
                 ),
-                start=len("".join(parts)),
-                end=None,
+                start=start,
+                end=end,
                 error_type=para.tag,
                 explanation=(
                     correct.attrib.get("errorinfo", default="")
                     if correct is not None
                     else ""
                 ),
-                suggestions=[
+                suggestions=tuple(
                     correct.text if correct.text is not None else ""
                     for correct in para.xpath("./correct")
-                ],
+                ),
                 native_error_type=para.tag,
             )
 
-        if para.text:
-            parts.append(para.text)
-
-        for child in para:
-            if child.tag != "correct":
-                if self.is_non_nested_error(child):
-                    errors.append(self.extract_error_info(parts, errors, child))
-                else:
-                    self.extract_error_info(parts, errors, child)
-
-        if info is not None and para.tag.startswith("error"):
-            info.end = len("".join(parts))
-
         if para.tail:
             parts.append(para.tail)
+            end += len(para.tail)
 
-        return info
+        return info, end
 
     def fix_all_errors(self, d_errors):
         """Remove errors that cover the same area of the typo and msyn types."""
@@ -269,7 +298,7 @@ class GramChecker:
 
         d_pos = error.error_string.find("  ")
         start = error.start + d_pos
-        end = error.start + 3
+        end = start + 3
         return replace(
             error,
             start=start,
@@ -373,7 +402,7 @@ class GramChecker:
                     end=gramcheck_error[2],
                     error_type=gramcheck_error[3],
                     explanation=gramcheck_error[4],
-                    suggestions=gramcheck_error[5],
+                    suggestions=tuple(gramcheck_error[5]),
                     native_error_type=gramcheck_error[6],
                 )
                 for gramcheck_error in gramcheck_errors
@@ -9,6 +9,17 @@ from collections import Counter
 from giellaltgramtools.errordata import ErrorData
 from giellaltgramtools.testdata import TestData
 
+# Stands in for the missing side of unmatched errors and true negatives
+EMPTY_ERROR = ErrorData(
+    error_string="",
+    start=0,
+    end=0,
+    error_type="",
+    explanation="",
+    suggestions=(),
+    native_error_type="",
+)
+
 
 class GramTest:
 
@@ -30,29 +41,23 @@ class GramTest:
     ) -> bool:
         count: dict[str, int] = Counter()
 
-        true_positives = self.has_true_positives(
+        (
+            true_positives,
+            false_positives_1,
+            false_positives_2,
+            false_negatives_1,
+            false_negatives_2,
+        ) = self.compare_errors(
             test_result.expected_errors, test_result.gramcheck_errors
         )
-        count["tp"] = len(true_positives)
         true_negatives = self.has_true_negatives(
             test_result.expected_errors, test_result.gramcheck_errors
         )
+        count["tp"] = len(true_positives)
         count["tn"] = len(true_negatives)
-        false_positives_1 = self.has_false_positives_1(
-            test_result.expected_errors, test_result.gramcheck_errors
-        )
         count["fp1"] = len(false_positives_1)
-        false_positives_2 = self.has_false_positives_2(
-            test_result.expected_errors, test_result.gramcheck_errors
-        )
         count["fp2"] = len(false_positives_2)
-        false_negatives_1 = self.has_false_negatives_1(
-            test_result.expected_errors, test_result.gramcheck_errors
-        )
         count["fn1"] = len(false_negatives_1)
-        false_negatives_2 = self.has_false_negatives_2(
-            test_result.expected_errors, test_result.gramcheck_errors
-        )
         count["fn2"] = len(false_negatives_2)
 
         has_fails = any(
@@ -94,21 +99,12 @@ class GramTest:
                 test_result.filename,
             )
 
-        expected_error = ErrorData(
-            error_string="",
-            start=0,
-            end=0,
-            error_type="",
-            explanation="",
-            suggestions=[],
-            native_error_type="",
-        )
         for false_positive_2 in false_positives_2:
             out.failure(
                 test_number,
                 length,
                 "fp2",
-                expected_error,
+                EMPTY_ERROR,
                 false_positive_2,
                 test_result.filename,
             )
@@ -123,22 +119,13 @@ class GramTest:
                 test_result.filename,
             )
 
-        gramcheck_error = ErrorData(
-            error_string="",
-            start=0,
-            end=0,
-            error_type="",
-            explanation="",
-            suggestions=[],
-            native_error_type="",
-        )
         for false_negative_2 in false_negatives_2:
             out.failure(
                 test_number,
                 length,
                 "fn2",
                 false_negative_2,
-                gramcheck_error,
+                EMPTY_ERROR,
                 test_result.filename,
             )
 
@@ -151,122 +138,100 @@ class GramTest:
         # Did this test sentence as a whole pass or not
         return not has_fails
 
-    def has_same_range_and_error(self, c_error: ErrorData, d_error: ErrorData) -> bool:
+    @staticmethod
+    def has_same_range_and_error(c_error: ErrorData, d_error: ErrorData) -> bool:
         """Check if the errors have the same range and error"""
-        if d_error.error_type == "double-space-before":
-            return [c_error.start, c_error.end] == [d_error.start, d_error.end]
-        else:
-            return [c_error.error_string, c_error.start, c_error.end] == [
-                d_error.error_string,
-                d_error.start,
-                d_error.end,
-            ]
-
-    def has_suggestions_with_hit(self, c_error: ErrorData, d_error: ErrorData):
+        if c_error.start != d_error.start or c_error.end != d_error.end:
+            return False
+
+        return (
+            d_error.error_type == "double-space-before"
+            or c_error.error_string == d_error.error_string
+        )
+
+    @staticmethod
+    def has_suggestions_with_hit(c_error: ErrorData, d_error: ErrorData):
         """Check if markup error correction exists in grammarchecker error."""
         return (
             len(d_error.suggestions) > 0
-            and self.has_same_range_and_error(c_error, d_error)
-            and any(correct in d_error.suggestions for correct in c_error.suggestions)
+            and GramTest.has_same_range_and_error(c_error, d_error)
+            and not set(d_error.suggestions).isdisjoint(c_error.suggestions)
         )
 
     def has_true_negatives(
         self, correct: list[ErrorData], dc: list[ErrorData]
     ) -> list[tuple[ErrorData, ErrorData]]:
         if not correct and not dc:
-            return [
-                (
-                    ErrorData(
-                        error_string="",
-                        start=0,
-                        end=0,
-                        error_type="",
-                        explanation="",
-                        suggestions=[],
-                        native_error_type="",
-                    ),
-                    ErrorData(
-                        error_string="",
-                        start=0,
-                        end=0,
-                        error_type="",
-                        explanation="",
-                        suggestions=[],
-                        native_error_type="",
-                    ),
-                )
-            ]
+            return [(EMPTY_ERROR, EMPTY_ERROR)]
 
         return []
 
-    def has_true_positives(
+    def compare_errors(
         self, correct: list[ErrorData], dc: list[ErrorData]
-    ) -> list[tuple[ErrorData, ErrorData]]:
-        return [
-            (c_error, d_error)
-            for c_error in correct
-            for d_error in dc
-            if self.has_suggestions_with_hit(c_error, d_error)
-        ]
+    ) -> tuple[
+        list[tuple[ErrorData, ErrorData]],
+        list[tuple[ErrorData, ErrorData]],
+        list[ErrorData],
+        list[tuple[ErrorData, ErrorData]],
+        list[ErrorData],
+    ]:
+        """Sort marked up and found errors into positives and negatives.
+
+        Every pair of errors is compared only once.
+
+        Returns:
+            true positives, false positives 1 and 2, false negatives 1 and 2
+        """
+        true_positives: list[tuple[ErrorData, ErrorData]] = []
+        false_positives_1: list[tuple[ErrorData, ErrorData]] = []
+        false_negatives_1: list[tuple[ErrorData, ErrorData]] = []
+        matched_correct: set[int] = set()
+        matched_dc: set[int] = set()
+
+        # Errors can only match when their ranges are equal, so only compare
+        # against found errors with the same range
+        dc_by_range: dict[tuple[int, int], list[tuple[int, ErrorData]]] = {}
+        for d_index, d_error in enumerate(dc):
+            dc_by_range.setdefault((d_error.start, d_error.end), []).append(
+                (d_index, d_error)
+            )
 
-    def has_false_positives_1(
-        self, correct: list[ErrorData], dc: list[ErrorData]
-    ) -> list[tuple[ErrorData, ErrorData]]:
-        return [
-            (c_error, d_error)
-            for c_error in correct
-            for d_error in dc
-            if self.has_suggestions_without_hit(c_error, d_error)
+        has_same_range_and_error = self.has_same_range_and_error
+        for c_index, c_error in enumerate(correct):
+            for d_index, d_error in dc_by_range.get((c_error.start, c_error.end), ()):
+                if not has_same_range_and_error(c_error, d_error):
+                    continue
+                matched_correct.add(c_index)
+                matched_dc.add(d_index)
+                if self.has_no_suggestions(c_error, d_error):
+                    false_negatives_1.append((c_error, d_error))
+                elif self.has_suggestions_with_hit(c_error, d_error):
+                    true_positives.append((c_error, d_error))
+                else:
+                    false_positives_1.append((c_error, d_error))
+
+        false_positives_2 = [
+            d_error for d_index, d_error in enumerate(dc) if d_index not in matched_dc
+        ]
+        false_negatives_2 = [
+            c_error
+            for c_index, c_error in enumerate(correct)
+            if c_index not in matched_correct
         ]
 
-    def has_suggestions_without_hit(
-        self, c_error: ErrorData, d_error: ErrorData
-    ) -> bool:
         return (
-            self.has_same_range_and_error(c_error, d_error)
-            and len(d_error.suggestions) != 0
-            and not any(
-                correct in d_error.suggestions for correct in c_error.suggestions
-            )
+            true_positives,
+            false_positives_1,
+            false_positives_2,
+            false_negatives_1,
+            false_negatives_2,
         )
 
-    def has_false_positives_2(
-        self, correct: list[ErrorData], dc: list[ErrorData]
-    ) -> list[ErrorData]:
-        return [
-            d_error
-            for d_error in dc
-            if not any(
-                self.has_same_range_and_error(c_error, d_error) for c_error in correct
-            )
-        ]
-
-    def has_false_negatives_2(
-        self, c_errors: list[ErrorData], d_errors: list[ErrorData]
-    ) -> list[ErrorData]:
-        corrects: list[ErrorData] = []
-        for c_error in c_errors:
-            for d_error in d_errors:
-                if self.has_same_range_and_error(c_error, d_error):
-                    break
-            else:
-                corrects.append(c_error)
-
-        return corrects
-
-    def has_false_negatives_1(
-        self, correct: list[ErrorData], dc: list[ErrorData]
-    ) -> list[tuple[ErrorData, ErrorData]]:
-        return [
-            (c_error, d_error)
-            for c_error in correct
-            for d_error in dc
-            if self.has_no_suggestions(c_error, d_error)
-        ]
-
-    def has_no_suggestions(self, c_error: ErrorData, d_error: ErrorData) -> bool:
+    @staticmethod
+    def has_no_suggestions(c_error: ErrorData, d_error: ErrorData) -> bool:
         return (
-            self.has_same_range_and_error(c_error, d_error) and not d_error.suggestions
+            GramTest.has_same_range_and_error(c_error, d_error)
+            and not d_error.suggestions
         )
 
     def run(self) -> int:
@@ -3,8 +3,9 @@
 # Copyright © 2020-2024 UiT The Arctic University of Norway
 # License: GPL3  # noqa: ERA001
 # Author: Børre Gaup <borre.gaup@uit.no>
+import re
 import sys
-from io import StringIO
+from copy import deepcopy
 from pathlib import Path
 from typing import Iterable
 
@@ -22,6 +23,17 @@ from giellaltgramtools.normaloutput import NormalOutput
 from giellaltgramtools.testdata import TestData
 from giellaltgramtools.yaml_gramchecker import YamlGramChecker
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper  # type: ignore
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
+# A test in the Tests list, in double, single or no quotes, optionally
+# followed by a comment
+TEST_LINE = re.compile(rb"""-\s+(["']?)(.*?)\1(?:\s+#.*)?""")
+
 
 class YamlGramTest(GramTest):
     explanations = {
@@ -53,6 +65,7 @@ class YamlGramTest(GramTest):
                 COLORS[key] = ""
 
         yaml_settings = self.yaml_reader(config["test_file"])
+        config["yaml_settings"] = yaml_settings
 
         config["spec"] = (
             config["test_file"].parent / yaml_settings.get("Config").get("Spec")
@@ -73,7 +86,7 @@ class YamlGramTest(GramTest):
             )
             sys.exit(99)  # exit code 99 signals hard exit to Make
         dupes = "\n".join(
-            {f"\t{test}" for test in config["tests"] if config["tests"].count(test) > 1}
+            f"\t{test}" for test in self.get_duplicate_tests(config["tests"])
         )
         if dupes:  # check for duplicates
             print(
@@ -84,10 +97,32 @@ class YamlGramTest(GramTest):
 
         return config
 
+    @staticmethod
+    def get_duplicate_tests(tests: list) -> list:
+        """Find the tests that occur more than once, in one pass."""
+        seen: set = set()
+        # Tests that yaml did not read as strings, e.g. dicts, may not be
+        # hashable. They are rare, so compare them by equality.
+        seen_unhashable: list = []
+        dupes: list = []
+        for test in tests:
+            try:
+                is_dupe = test in seen
+            except TypeError:
+                is_dupe = test in seen_unhashable
+                if not is_dupe:
+                    seen_unhashable.append(test)
+            else:
+                seen.add(test)
+            if is_dupe and test not in dupes:
+                dupes.append(test)
+
+        return dupes
+
     @staticmethod
     def yaml_reader(test_file):
-        with test_file.open() as test_file:
-            return yaml.load(test_file, Loader=yaml.FullLoader)
+        with test_file.open("rb") as test_stream:
+            return yaml.load(test_stream, Loader=YamlLoader)
 
     def make_error_markup(self, text: str) -> _Element:
         para: _Element = Element("p")
@@ -109,50 +144,86 @@ class YamlGramTest(GramTest):
             grammarchecker.paragraph_to_testdata(self.make_error_markup(text))
             for text in self.config["tests"]
         ]
-        grammar_datas = grammarchecker.check_paragraphs(
-            "\n".join(error_data[0] for error_data in error_datas)
+        # The same sentence is often tested with different markup, only
+        # send each distinct sentence to the grammarchecker once
+        sentences = list(dict.fromkeys(error_data[0] for error_data in error_datas))
+        grammar_datas = dict(
+            zip(
+                sentences,
+                grammarchecker.check_paragraphs("\n".join(sentences)),
+                strict=True,
+            )
         )
 
+        # clean_data modifies the grammarchecker errors, so each test
+        # gets its own copy
         return (
             grammarchecker.clean_data(
-                sentence=item[0][0],
-                expected_errors=item[0][1],
-                gramcheck_errors=item[1],
+                sentence=sentence,
+                expected_errors=expected_errors,
+                gramcheck_errors=deepcopy(grammar_datas[sentence]),
                 filename=self.config["test_file"].name,
             )
-            for item in zip(error_datas, grammar_datas, strict=True)
+            for sentence, expected_errors in error_datas
         )
 
+    def move_tests(self, tests: list[str], target_path: Path) -> None:
+        """Move tests from the current test file to target_path.
+
+        The test file is read and rewritten once, and the moved tests are
+        appended to target_path in a single write. Lines are handled as
+        bytes, there is no need to decode and encode the whole file.
+        """
+        if not tests:
+            return
+
+        if not target_path.exists():
+            # Start a new test file with the settings already read from
+            # the current test file
+            header = yaml.dump(
+                {
+                    key: value
+                    for key, value in self.config["yaml_settings"].items()
+                    if key != "Tests"
+                },
+                Dumper=YamlDumper,
+                allow_unicode=True,
+                encoding="utf-8",
+            )
+            target_path.write_bytes(header + b"Tests:\n")
+
+        with target_path.open("ab") as target_stream:
+            target_stream.write(
+                "".join(f'  - "{this_test}"\n' for this_test in tests).encode("utf-8")
+            )
+
+        moved_tests = frozenset(this_test.encode("utf-8") for this_test in tests)
+        test_file = self.config["test_file"]
+        lines = test_file.read_bytes().splitlines(keepends=True)
+        kept_lines = [
+            line for line in lines if self.test_in_line(line) not in moved_tests
+        ]
+        if len(kept_lines) != len(lines):
+            test_file.write_bytes(b"".join(kept_lines))
+
+    @staticmethod
+    def test_in_line(line: bytes) -> bytes | None:
+        """Return the test of a YAML list item line, without quotes."""
+        test_line = TEST_LINE.fullmatch(line.strip())
+        return test_line.group(2) if test_line is not None else None
+
     def move_passes_from_fail(self) -> None:
-        if "FAIL" in self.config["test_file"].name and any(self.test_outcomes):
+        if "FAIL" in self.config["test_file"].name:
             passing_tests = [
                 self.config["tests"][index]
                 for (index, test_result) in enumerate(self.test_outcomes)
                 if test_result
             ]
 
-            pass_path = Path(str(self.config["test_file"]).replace("FAIL", "PASS"))
-            with pass_path.open("a") as pass_stream:
-                print(
-                    "\n".join([f'  - "{this_test}"' for this_test in passing_tests]),
-                    file=pass_stream,
-                )
-
-            with StringIO() as temp_stream:
-                with self.config["test_file"].open("r") as _input:
-                    temp_stream.write(
-                        "".join(
-                            [
-                                line
-                                for line in _input
-                                if not any(
-                                    passing_test in line.strip()
-                                    for passing_test in passing_tests
-                                )
-                            ]
-                        )
-                    )
-                self.config["test_file"].open("w").write(temp_stream.getvalue())
+            self.move_tests(
+                passing_tests,
+                Path(str(self.config["test_file"]).replace("FAIL", "PASS")),
+            )
 
     def run(self) -> int:
         failed_or_not = super().run()
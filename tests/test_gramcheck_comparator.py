@@ -1,386 +1,537 @@
 """Test grammarcheck tester functionality"""
-import unittest
-import gramcheck_comparator
-from parameterized import parameterized
-from lxml import etree
 
+from copy import deepcopy
+from dataclasses import replace
+
+import pytest
+from lxml import etree
 
-class TestGramChecker(unittest.TestCase):
-    """Test grammarcheck tester"""
+from giellaltgramtools.errordata import ErrorData
+from giellaltgramtools.gramchecker import GramChecker
+from giellaltgramtools.gramtest import GramTest
 
-    def setUp(self) -> None:
-        self.gram_checker = gramcheck_comparator.CorpusGramChecker(
-            "/usr/share/voikko/4/se.zcheck"
-        )
-        return super().setUp()
+C_ERROR = ErrorData(
+    error_string="c", start=3, end=6, error_type="", explanation="", suggestions=()
+)
+C_ERROR_B = replace(C_ERROR, suggestions=("b",))
+C_ERRORSYN = replace(C_ERROR, error_type="errorsyn")
+C_ERRORSYN_A = replace(C_ERRORSYN, suggestions=("a",))
+C_MSYN = replace(C_ERROR, error_type="msyn")
+DOUBLE_SPACE = replace(C_ERROR, error_string="", error_type="double-space-before")
 
-    @parameterized.expand(
+EXTRACT_ERROR_INFO_CASES = (
+    (
+        '<p>Mun lean <errorort>sjievnnjis<correct errorinfo="conc,vnn-vnnj">sjievnnijis</correct></errorort></p>',
+        ["Mun lean ", "sjievnnjis"],
         [
-            (
-                '<p>Mun lean <errorort>sjievnnjis<correct errorinfo="conc,vnn-vnnj">sjievnnijis</correct></errorort></p>',
-                ["Mun lean ", "sjievnnjis"],
-                [["sjievnnjis", 9, 19, "errorort", "conc,vnn-vnnj", ["sjievnnijis"]]],
-            ),
-            (
-                "<p><errormorphsyn>Nieiddat leat nuorra"
-                '<correct errorinfo="a,spred,nompl,nomsg,agr">Nieiddat leat nuorat</correct>'
-                "</errormorphsyn></p>",
-                ["Nieiddat leat nuorra"],
-                [
-                    [
-                        "Nieiddat leat nuorra",
-                        0,
-                        20,
-                        "errormorphsyn",
-                        "a,spred,nompl,nomsg,agr",
-                        ["Nieiddat leat nuorat"],
-                    ]
-                ],
-            ),
-            (
-                "<p>gitta "
-                "<errorort>Nordkjosbotn ii<correct>Nordkjosbotnii</correct></errorort> "
-                "(mii lea ge "
-                "<errorort>nordkjosbotn<correct>Nordkjosbotn</correct></errorort> "
-                "sámegillii? Muhtin, veahket mu!) gos</p>",
-                [
-                    "gitta ",
-                    "Nordkjosbotn ii",
-                    " (mii lea ge ",
-                    "nordkjosbotn",
-                    " sámegillii? Muhtin, veahket mu!) gos",
-                ],
-                [
-                    ["Nordkjosbotn ii", 6, 21, "errorort", "", ["Nordkjosbotnii"]],
-                    ["nordkjosbotn", 34, 46, "errorort", "", ["Nordkjosbotn"]],
-                ],
-            ),
-            (
-                "<p>"
-                "<errormorphsyn>"
-                "<errorort>"
-                "šaddai"
-                '<correct errorinfo="verb,conc">šattai</correct>'
-                "</errorort> ollu áššit"
-                '<correct errorinfo="verb,fin,pl3prs,sg3prs,tense">šadde ollu áššit</correct>'
-                "</errormorphsyn></p>",
-                ["šaddai", " ollu áššit"],
-                [["šaddai", 0, 6, "errorort", "verb,conc", ["šattai"]]],
-            ),
-            (
-                "<p>a "
-                "<errorformat>"
-                "b  c"
-                '<correct errorinfo="notspace">b c</correct>'
-                "</errorformat>"
-                " d.</p>",
-                ["a ", "b  c", " d."],
-                [["b  c", 2, 6, "errorformat", "notspace", ["b c"]]],
+            ErrorData(
+                error_string="sjievnnjis",
+                start=9,
+                end=19,
+                error_type="errorort",
+                explanation="conc,vnn-vnnj",
+                suggestions=("sjievnnijis",),
+                native_error_type="errorort",
+            )
+        ],
+    ),
+    (
+        "<p><errormorphsyn>Nieiddat leat nuorra"
+        '<correct errorinfo="a,spred,nompl,nomsg,agr">Nieiddat leat nuorat</correct>'
+        "</errormorphsyn></p>",
+        ["Nieiddat leat nuorra"],
+        [
+            ErrorData(
+                error_string="Nieiddat leat nuorra",
+                start=0,
+                end=20,
+                error_type="errormorphsyn",
+                explanation="a,spred,nompl,nomsg,agr",
+                suggestions=("Nieiddat leat nuorat",),
+                native_error_type="errormorphsyn",
+            )
+        ],
+    ),
+    (
+        "<p>gitta "
+        "<errorort>Nordkjosbotn ii<correct>Nordkjosbotnii</correct></errorort> "
+        "(mii lea ge "
+        "<errorort>nordkjosbotn<correct>Nordkjosbotn</correct></errorort> "
+        "sámegillii? Muhtin, veahket mu!) gos</p>",
+        [
+            "gitta ",
+            "Nordkjosbotn ii",
+            " (mii lea ge ",
+            "nordkjosbotn",
+            " sámegillii? Muhtin, veahket mu!) gos",
+        ],
+        [
+            ErrorData(
+                error_string="Nordkjosbotn ii",
+                start=6,
+                end=21,
+                error_type="errorort",
+                explanation="",
+                suggestions=("Nordkjosbotnii",),
+                native_error_type="errorort",
             ),
-            (
-                "<p>Kondomat <errormorphsyn>juhkkojuvvo<correct>juhkkojuvvojedje</correct><correct>juhkkojuvvojit</correct></errormorphsyn> dehe <errormorphsyn>vuvdojuvvo<correct>vuvdojuvvojedje</correct><correct>vuvdojuvvojit</correct></errormorphsyn> nuoraidvuostáváldimis.</p>",
-                [
-                    "Kondomat ",
-                    "juhkkojuvvo",
-                    " dehe ",
-                    "vuvdojuvvo",
-                    " nuoraidvuostáváldimis.",
-                ],
-                [
-                    [
-                        "juhkkojuvvo",
-                        9,
-                        20,
-                        "errormorphsyn",
-                        "",
-                        ["juhkkojuvvojedje", "juhkkojuvvojit"],
-                    ],
-                    [
-                        "vuvdojuvvo",
-                        26,
-                        36,
-                        "errormorphsyn",
-                        "",
-                        ["vuvdojuvvojedje", "vuvdojuvvojit"],
-                    ],
-                ],
+            ErrorData(
+                error_string="nordkjosbotn",
+                start=34,
+                end=46,
+                error_type="errorort",
+                explanation="",
+                suggestions=("Nordkjosbotn",),
+                native_error_type="errorort",
             ),
-        ]
-    )
-    def test_extract_error_info(self, paragraph, want_parts, want_errors):
-        parts = []
-        errors = []
-        self.gram_checker.extract_error_info(parts, errors, etree.fromstring(paragraph))
-
-        self.assertListEqual(parts, want_parts)
-        self.assertListEqual(errors, want_errors)
-
-    @parameterized.expand(
+        ],
+    ),
+    (
+        "<p>"
+        "<errormorphsyn>"
+        "<errorort>"
+        "šaddai"
+        '<correct errorinfo="verb,conc">šattai</correct>'
+        "</errorort> ollu áššit"
+        '<correct errorinfo="verb,fin,pl3prs,sg3prs,tense">šadde ollu áššit</correct>'
+        "</errormorphsyn></p>",
+        ["šaddai", " ollu áššit"],
         [
-            (
-                "<p>"
-                "<errormorphsyn>"
-                "<errorort>"
-                "šaddai"
-                '<correct errorinfo="verb,conc">šattai</correct>'
-                "</errorort> ollu áššit"
-                '<correct errorinfo="verb,fin,pl3prs,sg3prs,tense">šadde ollu áššit</correct>'
-                "</errormorphsyn></p>",
-                "<p>"
-                "<errormorphsyn>"
-                "šattai ollu áššit"
-                '<correct errorinfo="verb,fin,pl3prs,sg3prs,tense">šadde ollu áššit</correct>'
-                "</errormorphsyn></p>",
+            ErrorData(
+                error_string="šaddai",
+                start=0,
+                end=6,
+                error_type="errorort",
+                explanation="verb,conc",
+                suggestions=("šattai",),
+                native_error_type="errorort",
             )
-        ]
-    )
-    def test_correct_lowest_level(self, para, wanted):
-        corrected = self.gram_checker.correct_lowest_level(etree.fromstring(para))
-        self.assertEqual(etree.tostring(corrected, encoding="unicode"), wanted)
-
-    @parameterized.expand(
+        ],
+    ),
+    (
+        "<p>a "
+        "<errorformat>"
+        "b  c"
+        '<correct errorinfo="notspace">b c</correct>'
+        "</errorformat>"
+        " d.</p>",
+        ["a ", "b  c", " d."],
         [
-            (
-                [["b  c", 2, 6, "errorformat", "notspace", ["b c"]]],
-                [["c", 3, 6, "errorformat", "notspace", ["b c"]]],
+            ErrorData(
+                error_string="b  c",
+                start=2,
+                end=6,
+                error_type="errorformat",
+                explanation="notspace",
+                suggestions=("b c",),
+                native_error_type="errorformat",
             )
-        ]
-    )
-    def test_normalise_error_markup(self, errors, wanted_errors):
-        self.gram_checker.normalise_error_markup(errors)
-        self.assertListEqual(errors, wanted_errors)
-
-    @parameterized.expand(
+        ],
+    ),
+    (
+        "<p>Kondomat <errormorphsyn>juhkkojuvvo<correct>juhkkojuvvojedje</correct><correct>juhkkojuvvojit</correct></errormorphsyn> dehe <errormorphsyn>vuvdojuvvo<correct>vuvdojuvvojedje</correct><correct>vuvdojuvvojit</correct></errormorphsyn> nuoraidvuostáváldimis.</p>",
         [
-            (
-                [
-                    "“Dálveleaikkat“",
-                    7,
-                    22,
-                    "punct-aistton-both",
-                    "Boasttuaisttonmearkkat",
-                    ["”Dálveleaikkat”"],
-                    "Aisttonmearkkat",
-                ],
-                [
-                    [
-                        "“Dálveleaikkat“",
-                        7,
-                        22,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”Dálveleaikkat”"],
-                        "Aisttonmearkkat",
-                    ]
-                ],
-                0,
-                [
-                    [
-                        "“",
-                        7,
-                        8,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”"],
-                        "Aisttonmearkkat",
-                    ],
-                    [
-                        "“",
-                        21,
-                        22,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”"],
-                        "Aisttonmearkkat",
-                    ],
-                ],
-            )
-        ]
-    )
-    def test_fix_aistton_both(self, error, errors, position, wanted_errors):
-        self.gram_checker.fix_aistton_both(error, errors, position)
-        self.assertListEqual(errors, wanted_errors)
-
-    @parameterized.expand(
+            "Kondomat ",
+            "juhkkojuvvo",
+            " dehe ",
+            "vuvdojuvvo",
+            " nuoraidvuostáváldimis.",
+        ],
         [
-            (
-                [
-                    [
-                        '"Goaskin viellja"',
-                        15,
-                        32,
-                        "msyn-compound",
-                        '"Goaskin viellja" orru leamen goallossátni',
-                        ['"Goaskinviellja"'],
-                        "Goallosteapmi",
-                    ],
-                    [
-                        '"Goaskin viellja"',
-                        15,
-                        32,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”Goaskin viellja”"],
-                        "Aisttonmearkkat",
-                    ],
-                ],
-                [
-                    [
-                        "Goaskin viellja",
-                        16,
-                        31,
-                        "msyn-compound",
-                        '"Goaskin viellja" orru leamen goallossátni',
-                        ["Goaskinviellja"],
-                    ],
-                    [
-                        '"Goaskin viellja"',
-                        15,
-                        32,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”Goaskin viellja”"],
-                        "Aisttonmearkkat",
-                    ],
-                ],
+            ErrorData(
+                error_string="juhkkojuvvo",
+                start=9,
+                end=20,
+                error_type="errormorphsyn",
+                explanation="",
+                suggestions=("juhkkojuvvojedje", "juhkkojuvvojit"),
+                native_error_type="errormorphsyn",
             ),
-            (
-                [
-                    [
-                        "dálve olympiijagilvvuid",
-                        22,
-                        45,
-                        "msyn-compound",
-                        '"dálve olympiijagilvvuid" orru leamen goallossátni',
-                        ["dálveolympiagilvvuid"],
-                        "Goallosteapmi",
-                    ],
-                    [
-                        "CDa",
-                        53,
-                        56,
-                        "typo",
-                        "Ii leat sátnelisttus",
-                        ["CD"],
-                        "Čállinmeattáhus",
-                    ],
-                    [
-                        "“Dálveleaikat“",
-                        78,
-                        92,
-                        "real-PlNomPxSg2-PlNom",
-                        "Sátni šaddá eará go oaivvilduvvo",
-                        ["“Dálveleaikkat“"],
-                        "Čállinmeattáhus dán oktavuođas",
-                    ],
-                    [
-                        "“Dálveleaikat“",
-                        78,
-                        92,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”Dálveleaikat”"],
-                        "Aisttonmearkkat",
-                    ],
-                ],
-                [
-                    [
-                        "dálve olympiijagilvvuid",
-                        22,
-                        45,
-                        "msyn-compound",
-                        '"dálve olympiijagilvvuid" orru leamen goallossátni',
-                        ["dálveolympiagilvvuid"],
-                        "Goallosteapmi",
-                    ],
-                    [
-                        "CDa",
-                        53,
-                        56,
-                        "typo",
-                        "Ii leat sátnelisttus",
-                        ["CD"],
-                        "Čállinmeattáhus",
-                    ],
-                    [
-                        "Dálveleaikat",
-                        79,
-                        91,
-                        "real-PlNomPxSg2-PlNom",
-                        "Sátni šaddá eará go oaivvilduvvo",
-                        ["Dálveleaikkat"],
-                        "Čállinmeattáhus dán oktavuođas",
-                    ],
-                    [
-                        "“Dálveleaikat“",
-                        78,
-                        92,
-                        "punct-aistton-both",
-                        "Boasttuaisttonmearkkat",
-                        ["”Dálveleaikat”"],
-                        "Aisttonmearkkat",
-                    ],
-                ],
+            ErrorData(
+                error_string="vuvdojuvvo",
+                start=26,
+                end=36,
+                error_type="errormorphsyn",
+                explanation="",
+                suggestions=("vuvdojuvvojedje", "vuvdojuvvojit"),
+                native_error_type="errormorphsyn",
             ),
-        ]
-    )
-    def test_fix_hidden_by_aistton_both(self, errors, wanted_errors):
-        self.assertListEqual(
-            self.gram_checker.fix_hidden_by_aistton_both(errors), wanted_errors
-        )
+        ],
+    ),
+)
 
+# The paragraphs are plain markup, so ids and entities need no handling
+PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False, no_network=True)
 
-class TestGramTester(unittest.TestCase):
-    """Test grammarcheck tester"""
+# extract_error_info only reads the paragraphs, so parse each one once.
+# libxml2 reads UTF-8 bytes directly, str input is encoded by lxml first.
+PARSED_PARAGRAPHS = {
+    paragraph: etree.fromstring(paragraph.encode("utf-8"), PARSER)
+    for paragraph, _, _ in EXTRACT_ERROR_INFO_CASES
+}
 
-    def setUp(self) -> None:
-        self.gram_test = gramcheck_comparator.GramTest()
-        return super().setUp()
+NORMALISE_ERROR_MARKUP_CASES = (
+    (
+        ErrorData(
+            error_string="b  c",
+            start=2,
+            end=6,
+            error_type="errorformat",
+            explanation="notspace",
+            suggestions=("b c",),
+        ),
+        ErrorData(
+            error_string="c",
+            start=3,
+            end=6,
+            error_type="errorformat",
+            explanation="notspace",
+            suggestions=("b c",),
+        ),
+    ),
+)
 
-    @parameterized.expand(
+FIX_AISTTON_BOTH_CASES = (
+    (
         [
-            (["c", 3, 6, "", "", []], ["", 3, 6, "double-space-before", "", []], True),
-            (["c", 3, 6, "", "", []], ["", 2, 5, "double-space-before", "", []], False),
-            (["c", 3, 6, "errorsyn", "", []], ["d", 3, 6, "msyn", "", []], False),
-            (["c", 3, 6, "errorsyn", "", []], ["c", 2, 6, "msyn", "", []], False),
-            (["c", 3, 6, "errorsyn", "", []], ["c", 3, 5, "msyn", "", []], False),
-            (["c", 3, 6, "errorsyn", "", []], ["c", 3, 6, "msyn", "", []], True),
-        ]
-    )
-    def test_same_range_and_error(self, c_error, d_error, expected_boolean):
-        self.assertTrue(
-            self.gram_test.has_same_range_and_error(c_error, d_error)
-            == expected_boolean
-        )
-
-    @parameterized.expand(
+            [
+                "“Dálveleaikkat“",
+                7,
+                22,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”Dálveleaikkat”"],
+                "Aisttonmearkkat",
+            ]
+        ],
+        0,
         [
-            (["c", 3, 6, "", "", []], ["", 3, 6, "double-space-before", "", []], False),
-            (
-                ["c", 3, 6, "", "", ["b"]],
-                ["c", 3, 6, "double-space-before", "", ["a"]],
-                False,
-            ),
-            (["c", 3, 6, "errorsyn", "", []], ["c", 3, 6, "msyn", "", []], False),
-            (
-                ["c", 3, 6, "errorsyn", "", ["a"]],
-                ["c", 3, 6, "msyn", "", ["a", "b"]],
-                True,
-            ),
-        ]
-    )
-    def test_suggestion_with_hits(self, c_error, d_error, expected_boolean):
-        self.assertEqual(
-            self.gram_test.has_suggestions_with_hit(c_error, d_error), expected_boolean
-        )
-
-    @parameterized.expand(
+            [
+                "“",
+                7,
+                8,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”"],
+                "Aisttonmearkkat",
+            ],
+            [
+                "“",
+                21,
+                22,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”"],
+                "Aisttonmearkkat",
+            ],
+        ],
+    ),
+)
+
+FIX_HIDDEN_BY_AISTTON_BOTH_CASES = (
+    (
+        [
+            [
+                '"Goaskin viellja"',
+                15,
+                32,
+                "msyn-compound",
+                '"Goaskin viellja" orru leamen goallossátni',
+                ['"Goaskinviellja"'],
+                "Goallosteapmi",
+            ],
+            [
+                '"Goaskin viellja"',
+                15,
+                32,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”Goaskin viellja”"],
+                "Aisttonmearkkat",
+            ],
+        ],
         [
-            (["c", 3, 6, "", "", ["b"]], ["c", 3, 6, "", "", ["b"]], False),
-            (["c", 3, 6, "", "", ["b"]], ["c", 3, 6, "", "", []], True),
-        ]
-    )
-    def test_has_no_suggesions(self, c_error, d_error, expected_boolean):
-        self.assertEqual(
-            self.gram_test.has_no_suggestions(c_error, d_error), expected_boolean
-        )
+            [
+                "Goaskin viellja",
+                16,
+                31,
+                "msyn-compound",
+                '"Goaskin viellja" orru leamen goallossátni',
+                ["Goaskinviellja"],
+                "Goallosteapmi",
+            ],
+            [
+                '"Goaskin viellja"',
+                15,
+                32,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”Goaskin viellja”"],
+                "Aisttonmearkkat",
+            ],
+        ],
+    ),
+    (
+        [
+            [
+                "dálve olympiijagilvvuid",
+                22,
+                45,
+                "msyn-compound",
+                '"dálve olympiijagilvvuid" orru leamen goallossátni',
+                ["dálveolympiagilvvuid"],
+                "Goallosteapmi",
+            ],
+            [
+                "CDa",
+                53,
+                56,
+                "typo",
+                "Ii leat sátnelisttus",
+                ["CD"],
+                "Čállinmeattáhus",
+            ],
+            [
+                "“Dálveleaikat“",
+                78,
+                92,
+                "real-PlNomPxSg2-PlNom",
+                "Sátni šaddá eará go oaivvilduvvo",
+                ["“Dálveleaikkat“"],
+                "Čállinmeattáhus dán oktavuođas",
+            ],
+            [
+                "“Dálveleaikat“",
+                78,
+                92,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”Dálveleaikat”"],
+                "Aisttonmearkkat",
+            ],
+        ],
+        [
+            [
+                "dálve olympiijagilvvuid",
+                22,
+                45,
+                "msyn-compound",
+                '"dálve olympiijagilvvuid" orru leamen goallossátni',
+                ["dálveolympiagilvvuid"],
+                "Goallosteapmi",
+            ],
+            [
+                "CDa",
+                53,
+                56,
+                "typo",
+                "Ii leat sátnelisttus",
+                ["CD"],
+                "Čállinmeattáhus",
+            ],
+            [
+                "Dálveleaikat",
+                79,
+                91,
+                "real-PlNomPxSg2-PlNom",
+                "Sátni šaddá eará go oaivvilduvvo",
+                ["Dálveleaikkat"],
+                "Čállinmeattáhus dán oktavuođas",
+            ],
+            [
+                "“Dálveleaikat“",
+                78,
+                92,
+                "punct-aistton-both",
+                "Boasttuaisttonmearkkat",
+                ["”Dálveleaikat”"],
+                "Aisttonmearkkat",
+            ],
+        ],
+    ),
+)
+
+SAME_RANGE_AND_ERROR_CASES = (
+    (C_ERROR, DOUBLE_SPACE, True),
+    (C_ERROR, replace(DOUBLE_SPACE, start=2, end=5), False),
+    (C_ERRORSYN, replace(C_MSYN, error_string="d"), False),
+    (C_ERRORSYN, replace(C_MSYN, start=2), False),
+    (C_ERRORSYN, replace(C_MSYN, end=5), False),
+    (C_ERRORSYN, C_MSYN, True),
+)
+
+SUGGESTION_WITH_HITS_CASES = (
+    (C_ERROR, DOUBLE_SPACE, False),
+    (
+        C_ERROR_B,
+        replace(DOUBLE_SPACE, error_string="c", suggestions=("a",)),
+        False,
+    ),
+    (C_ERRORSYN, C_MSYN, False),
+    (C_ERRORSYN_A, replace(C_MSYN, suggestions=("a", "b")), True),
+)
+
+HAS_NO_SUGGESTIONS_CASES = (
+    (C_ERROR_B, C_ERROR_B, False),
+    (C_ERROR_B, C_ERROR, True),
+)
+
+C_MSYN_A = replace(C_MSYN, suggestions=("a",))
+C_MSYN_B = replace(C_MSYN, suggestions=("b",))
+OTHER_START = replace(C_MSYN, start=2)
+
+# (marked up errors, found errors,
+#  (true positives, false positives 1, false positives 2,
+#   false negatives 1, false negatives 2))
+COMPARE_ERRORS_CASES = (
+    ([C_ERRORSYN_A], [C_MSYN_A], ([(C_ERRORSYN_A, C_MSYN_A)], [], [], [], [])),
+    ([C_ERRORSYN_A], [C_MSYN_B], ([], [(C_ERRORSYN_A, C_MSYN_B)], [], [], [])),
+    ([C_ERRORSYN_A], [C_MSYN], ([], [], [], [(C_ERRORSYN_A, C_MSYN)], [])),
+    ([], [C_MSYN], ([], [], [C_MSYN], [], [])),
+    ([C_ERROR], [OTHER_START], ([], [], [OTHER_START], [], [C_ERROR])),
+    (
+        [C_ERROR_B],
+        [replace(DOUBLE_SPACE, suggestions=("b",))],
+        ([(C_ERROR_B, replace(DOUBLE_SPACE, suggestions=("b",)))], [], [], [], []),
+    ),
+    (
+        [C_ERRORSYN_A],
+        [C_MSYN_A, C_MSYN],
+        ([(C_ERRORSYN_A, C_MSYN_A)], [], [], [(C_ERRORSYN_A, C_MSYN)], []),
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def gram_checker():
+    # The tests only call methods that leave the checker untouched,
+    # so one instance serves the whole module
+    return GramChecker()
+
+
+@pytest.fixture(scope="module")
+def gram_test():
+    return GramTest()
+
+
+@pytest.mark.parametrize(
+    ("paragraph", "want_parts", "want_errors"),
+    EXTRACT_ERROR_INFO_CASES,
+    ids=(
+        "errorort",
+        "errormorphsyn",
+        "two-errorort",
+        "errorort-in-errormorphsyn",
+        "errorformat-double-space",
+        "several-corrections",
+    ),
+)
+def test_extract_error_info(gram_checker, paragraph, want_parts, want_errors):
+    parts = []
+    errors = []
+    gram_checker.extract_error_info(parts, errors, PARSED_PARAGRAPHS[paragraph])
+
+    assert parts == want_parts
+    assert errors == want_errors
+
+
+@pytest.mark.parametrize(
+    ("error", "wanted_error"),
+    NORMALISE_ERROR_MARKUP_CASES,
+    ids=("errorformat-double-space",),
+)
+def test_normalise_error_markup(gram_checker, error, wanted_error):
+    assert gram_checker.normalise_error_markup(error) == wanted_error
+
+
+@pytest.mark.parametrize(
+    ("errors", "position", "wanted_errors"),
+    FIX_AISTTON_BOTH_CASES,
+    ids=("wrong-quotes-both-ends",),
+)
+def test_fix_aistton_both(gram_checker, errors, position, wanted_errors):
+    # fix_aistton_both changes the errors in place, keep the case data intact
+    errors = deepcopy(errors)
+    gram_checker.fix_aistton_both(errors[position], errors, position)
+    assert errors == wanted_errors
+
+
+@pytest.mark.parametrize(
+    ("errors", "wanted_errors"),
+    FIX_HIDDEN_BY_AISTTON_BOTH_CASES,
+    ids=("msyn-compound", "msyn-compound-typo-real"),
+)
+def test_fix_hidden_by_aistton_both(gram_checker, errors, wanted_errors):
+    assert gram_checker.fix_hidden_by_aistton_both(errors) == wanted_errors
+
+
+@pytest.mark.parametrize(
+    ("c_error", "d_error", "expected_boolean"),
+    SAME_RANGE_AND_ERROR_CASES,
+    ids=(
+        "double-space-same-range",
+        "double-space-other-range",
+        "other-string",
+        "other-start",
+        "other-end",
+        "same-range-and-string",
+    ),
+)
+def test_same_range_and_error(gram_test, c_error, d_error, expected_boolean):
+    assert gram_test.has_same_range_and_error(c_error, d_error) == expected_boolean
+
+
+@pytest.mark.parametrize(
+    ("c_error", "d_error", "expected_boolean"),
+    SUGGESTION_WITH_HITS_CASES,
+    ids=("double-space-no-suggestions", "double-space-miss", "no-suggestions", "hit"),
+)
+def test_suggestion_with_hits(gram_test, c_error, d_error, expected_boolean):
+    assert gram_test.has_suggestions_with_hit(c_error, d_error) == expected_boolean
+
+
+@pytest.mark.parametrize(
+    ("c_error", "d_error", "expected_boolean"),
+    HAS_NO_SUGGESTIONS_CASES,
+    ids=("has-suggestions", "no-suggestions"),
+)
+def test_has_no_suggesions(gram_test, c_error, d_error, expected_boolean):
+    assert gram_test.has_no_suggestions(c_error, d_error) == expected_boolean
+
+
+@pytest.mark.parametrize(
+    ("correct", "dc", "expected"),
+    COMPARE_ERRORS_CASES,
+    ids=(
+        "true-positive",
+        "false-positive-1",
+        "false-negative-1",
+        "false-positive-2",
+        "false-negative-2",
+        "double-space-other-string",
+        "one-marked-two-found",
+    ),
+)
+def test_compare_errors(gram_test, correct, dc, expected):
+    assert gram_test.compare_errors(correct, dc) == expected
+
+
+TYPO_ERROR = ["CDa", 0, 3, "typo", "Ii leat sátnelisttus", ["CD"], "Čállinmeattáhus"]
+
+
+def test_check_sentence_reuses_results(monkeypatch):
+    gram_checker = GramChecker()
+    checked = []
+
+    def check_paragraphs(paragraphs):
+        checked.append(paragraphs)
+        return [[deepcopy(TYPO_ERROR)]]
+
+    monkeypatch.setattr(gram_checker, "check_paragraphs", check_paragraphs)
+
+    first = gram_checker.check_sentence("CDa")
+    first[0][5].append("CDe")
+    second = gram_checker.check_sentence("CDa")
+
+    assert checked == ["CDa"]
+    assert second == [TYPO_ERROR]
@@ -0,0 +1,113 @@
+"""Test YAML test file handling"""
+
+import pytest
+
+# yaml_gramtest imports corpustools at module level
+pytest.importorskip("corpustools")
+
+from giellaltgramtools.yaml_gramtest import YamlGramTest  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("line", "want"),
+    [
+        (b'  - "Mun lean"\n', b"Mun lean"),
+        (b"  - 'Mun lean'\n", b"Mun lean"),
+        (b"  - Mun lean\n", b"Mun lean"),
+        (b'  - "Mun lean" # note\n', b"Mun lean"),
+        (b"  - Mun lean # note\n", b"Mun lean"),
+        (b'  - "Mun # lean"\n', b"Mun # lean"),
+        (b"Config:\n", None),
+        (b"  Spec: x\n", None),
+    ],
+    ids=(
+        "double-quoted",
+        "single-quoted",
+        "unquoted",
+        "quoted-with-comment",
+        "unquoted-with-comment",
+        "hash-inside-quotes",
+        "mapping-key",
+        "mapping-item",
+    ),
+)
+def test_test_in_line(line, want):
+    assert YamlGramTest.test_in_line(line) == want
+
+
+FAIL_FILE = """Config:
+  Spec: ../pipespec.xml
+  Variants: [smegram-dev]
+
+Tests:
+  - "Mun lean boahtán"
+  - "Don leat boahtán"
+  - 'Son lea boahtán' # passes now
+"""
+
+
+def move_passes(tmp_path, test_outcomes=(False, True, True)):
+    """Run move_passes_from_fail, by default the last two tests pass."""
+    fail_file = tmp_path / "grammartests-FAIL.yaml"
+    fail_file.write_text(FAIL_FILE, encoding="utf-8")
+    yaml_test = YamlGramTest({"output": "silent", "colour": True}, fail_file)
+    yaml_test.test_outcomes = list(test_outcomes)
+    yaml_test.move_passes_from_fail()
+
+    return fail_file, tmp_path / "grammartests-PASS.yaml"
+
+
+def test_move_passes_from_fail_new_pass_file(tmp_path):
+    fail_file, pass_file = move_passes(tmp_path)
+
+    assert YamlGramTest.yaml_reader(fail_file) == {
+        "Config": {"Spec": "../pipespec.xml", "Variants": ["smegram-dev"]},
+        "Tests": ["Mun lean boahtán"],
+    }
+    assert YamlGramTest.yaml_reader(pass_file) == {
+        "Config": {"Spec": "../pipespec.xml", "Variants": ["smegram-dev"]},
+        "Tests": ["Don leat boahtán", "Son lea boahtán"],
+    }
+
+
+def test_move_passes_from_fail_existing_pass_file(tmp_path):
+    existing = (
+        "Config:\n"
+        "  Spec: ../pipespec.xml\n"
+        "  Variants: [smegram-dev]\n"
+        "\n"
+        "Tests:\n"
+        '  - "Mii leat boahtán" # already passing\n'
+    ).encode("utf-8")
+    (tmp_path / "grammartests-PASS.yaml").write_bytes(existing)
+
+    fail_file, pass_file = move_passes(tmp_path)
+
+    assert YamlGramTest.yaml_reader(fail_file)["Tests"] == ["Mun lean boahtán"]
+    assert pass_file.read_bytes().startswith(existing)
+    assert YamlGramTest.yaml_reader(pass_file)["Tests"] == [
+        "Mii leat boahtán",
+        "Don leat boahtán",
+        "Son lea boahtán",
+    ]
+
+
+def test_move_passes_from_fail_no_passes(tmp_path):
+    fail_file, pass_file = move_passes(tmp_path, test_outcomes=(False,) * 3)
+
+    assert fail_file.read_text(encoding="utf-8") == FAIL_FILE
+    assert not pass_file.exists()
+
+
+@pytest.mark.parametrize(
+    ("tests", "want"),
+    [
+        (["a", "b", "c"], []),
+        (["a", "b", "a", "c", "a"], ["a"]),
+        ([{"a": 1, "b": 2}, {"b": 2, "a": 1}], [{"a": 1, "b": 2}]),
+        (["a", {"a": 1}, "a", ["a"]], ["a"]),
+    ],
+    ids=("no-dupes", "string-dupes", "reordered-dicts", "mixed-types"),
+)
+def test_get_duplicate_tests(tests, want):
+    assert YamlGramTest.get_duplicate_tests(tests) == want